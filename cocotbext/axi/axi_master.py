@@ -34,6 +34,7 @@ from .version import __version__
 from .constants import AxiBurstType, AxiLockType, AxiProt, AxiResp
 from .axi_channels import AxiAWSource, AxiWSource, AxiBSink, AxiARSource, AxiRSink
 from .reset import Reset
+from .utils import _sorted_signal_list
 
 
 # AXI master write helper objects
@@ -123,7 +124,7 @@ class TagContext:
 
     def _start(self):
         if self._cr is None:
-            self._cr = cocotb.fork(self._process_queue())
+            self._cr = cocotb.start_soon(self._process_queue())
 
     def _flush(self):
         flushed_cmds = []
@@ -245,6 +246,7 @@ class AxiMasterWrite(Reset):
         self.awuser_present = hasattr(self.bus.aw, "awuser")
         self.wuser_present = hasattr(self.bus.w, "wuser")
         self.buser_present = hasattr(self.bus.b, "buser")
+        self.bresp_present = hasattr(self.bus.b, "bresp")
 
         self.log.info("AXI master configuration:")
         self.log.info("  Address width: %d bits", self.address_width)
@@ -257,7 +259,7 @@ class AxiMasterWrite(Reset):
 
         self.log.info("AXI master signals:")
         for bus in (self.bus.aw, self.bus.w, self.bus.b):
-            for sig in sorted(list(set().union(bus._signals, bus._optional_signals))):
+            for sig in _sorted_signal_list(bus):
                 if hasattr(bus, sig):
                     self.log.info("  %s width: %d bits", sig, len(getattr(bus, sig)))
                 else:
@@ -459,9 +461,9 @@ class AxiMasterWrite(Reset):
         else:
             self.log.info("Reset de-asserted")
             if self._process_write_cr is None:
-                self._process_write_cr = cocotb.fork(self._process_write())
+                self._process_write_cr = cocotb.start_soon(self._process_write())
             if self._process_write_resp_cr is None:
-                self._process_write_resp_cr = cocotb.fork(self._process_write_resp())
+                self._process_write_resp_cr = cocotb.start_soon(self._process_write_resp())
 
     async def _get_next_write(self):
         cmd = None
@@ -608,7 +610,7 @@ class AxiMasterWrite(Reset):
         while True:
             b = await self.b_channel.recv()
 
-            bid = int(getattr(b, 'bid', 0))
+            bid = int(b.bid)
 
             if self.active_id[bid] <= 0:
                 raise Exception(f"Unexpected burst ID {bid}")
@@ -624,8 +626,8 @@ class AxiMasterWrite(Reset):
         for burst_length in cmd.burst_list:
             b = await context.get_resp()
 
-            burst_resp = AxiResp(getattr(b, 'bresp', AxiResp.OKAY))
-            burst_user = int(getattr(b, 'buser', 0))
+            burst_resp = AxiResp(int(b.bresp)) if self.bresp_present else AxiResp.OKAY
+            burst_user = int(b.buser) if self.buser_present else 0
 
             if burst_resp != AxiResp.OKAY:
                 resp = burst_resp
@@ -705,6 +707,7 @@ class AxiMasterRead(Reset):
         self.arregion_present = hasattr(self.bus.ar, "arregion")
         self.aruser_present = hasattr(self.bus.ar, "aruser")
         self.ruser_present = hasattr(self.bus.r, "ruser")
+        self.rresp_present = hasattr(self.bus.r, "rresp")
 
         self.log.info("AXI master configuration:")
         self.log.info("  Address width: %d bits", self.address_width)
@@ -717,7 +720,7 @@ class AxiMasterRead(Reset):
 
         self.log.info("AXI master signals:")
         for bus in (self.bus.ar, self.bus.r):
-            for sig in sorted(list(set().union(bus._signals, bus._optional_signals))):
+            for sig in _sorted_signal_list(bus):
                 if hasattr(bus, sig):
                     self.log.info("  %s width: %d bits", sig, len(getattr(bus, sig)))
                 else:
@@ -898,9 +901,9 @@ class AxiMasterRead(Reset):
         else:
             self.log.info("Reset de-asserted")
             if self._process_read_cr is None:
-                self._process_read_cr = cocotb.fork(self._process_read())
+                self._process_read_cr = cocotb.start_soon(self._process_read())
             if self._process_read_resp_cr is None:
-                self._process_read_resp_cr = cocotb.fork(self._process_read_resp())
+                self._process_read_resp_cr = cocotb.start_soon(self._process_read_resp())
 
     async def _get_next_read(self):
         cmd = None
@@ -1008,7 +1011,7 @@ class AxiMasterRead(Reset):
         while True:
             r = await self.r_channel.recv()
 
-            rid = int(getattr(r, 'rid', 0))
+            rid = int(r.rid)
 
             if cur_rid is not None and cur_rid != rid:
                 raise Exception(f"ID not constant within burst (expected {cur_rid}, got {rid})")
@@ -1050,8 +1053,8 @@ class AxiMasterRead(Reset):
 
             for r in burst:
                 cycle_data = int(r.rdata)
-                cycle_resp = AxiResp(getattr(r, "rresp", AxiResp.OKAY))
-                cycle_user = int(getattr(r, "ruser", 0))
+                cycle_resp = AxiResp(int(r.rresp)) if self.rresp_present else AxiResp.OKAY
+                cycle_user = int(r.ruser) if self.ruser_present else 0
 
                 if cycle_resp != AxiResp.OKAY:
                     resp = cycle_resp
@@ -22,6 +22,7 @@ THE SOFTWARE.
 
 """
 
+import copy
 import logging
 
 import cocotb
@@ -29,8 +30,9 @@ import cocotb
 from .version import __version__
 from .constants import AxiBurstType, AxiProt, AxiResp
 from .axi_channels import AxiAWSink, AxiWSink, AxiBSource, AxiARSink, AxiRSource
-from .memory import Memory
+from .memory import Memory, _make_word_writer
 from .reset import Reset
+from .utils import _LazyHex, _sorted_signal_list
 
 
 class AxiRamWrite(Memory, Reset):
@@ -61,6 +63,14 @@ class AxiRamWrite(Memory, Reset):
         self.byte_lanes = self.width // self.byte_size
         self.strb_mask = 2**self.byte_lanes-1
 
+        self._strb_to_mask = {}
+
+        if self.byte_lanes <= 8:
+            # small enough to enumerate every strobe combination up front
+            for strb in range(2**self.byte_lanes):
+                self._strb_to_mask[strb] = int.from_bytes(bytes(0xff if strb & (1 << i) else 0
+                        for i in range(self.byte_lanes)), 'little')
+
         self.max_burst_size = (self.byte_lanes-1).bit_length()
 
         self.log.info("AXI RAM model configuration:")
@@ -72,7 +82,7 @@ class AxiRamWrite(Memory, Reset):
 
         self.log.info("AXI RAM model signals:")
         for bus in (self.bus.aw, self.bus.w, self.bus.b):
-            for sig in sorted(list(set().union(bus._signals, bus._optional_signals))):
+            for sig in _sorted_signal_list(bus):
                 if hasattr(bus, sig):
                     self.log.info("  %s width: %d bits", sig, len(getattr(bus, sig)))
                 else:
@@ -83,6 +93,18 @@ class AxiRamWrite(Memory, Reset):
 
         assert len(self.b_channel.bus.bid) == len(self.aw_channel.bus.awid)
 
+        # optional signal presence never changes after elaboration
+        self.awprot_present = hasattr(self.aw_channel.bus, 'awprot')
+
+        # power-of-two sizes can wrap addresses with a mask instead of a modulus
+        self._size_mask = self.size-1 if self.size & (self.size-1) == 0 else None
+
+        self._write_word = _make_word_writer(self.view, self.byte_lanes, self.strb_mask, self._strb_to_mask)
+
+        # only bid varies between B responses; clone a template per burst
+        self._b_resp = self.b_channel._transaction_obj()
+        self._b_resp.bresp = AxiResp.OKAY
+
         self._process_write_cr = None
 
         self._init_reset(reset, reset_active_level)
@@ -100,24 +122,38 @@ class AxiRamWrite(Memory, Reset):
         else:
             self.log.info("Reset de-asserted")
             if self._process_write_cr is None:
-                self._process_write_cr = cocotb.fork(self._process_write())
+                self._process_write_cr = cocotb.start_soon(self._process_write())
 
     async def _process_write(self):
+        log_info = self.log.isEnabledFor(logging.INFO)
+        log_debug = self.log.isEnabledFor(logging.DEBUG)
+
+        # bind hot attributes as locals; LOAD_FAST beats LOAD_ATTR per beat
+        aw_channel = self.aw_channel
+        w_channel = self.w_channel
+        b_channel = self.b_channel
+        byte_lanes = self.byte_lanes
+        mem_size = self.size
+        size_mask = self._size_mask
+        write_word = self._write_word
+        b_resp = self._b_resp
+
         while True:
-            aw = await self.aw_channel.recv()
+            aw = await aw_channel.recv()
 
-            awid = int(getattr(aw, 'awid', 0))
+            awid = int(aw.awid)
             addr = int(aw.awaddr)
-            length = int(getattr(aw, 'awlen', 0))
-            size = int(getattr(aw, 'awsize', self.max_burst_size))
-            burst = AxiBurstType(getattr(aw, 'awburst', AxiBurstType.INCR))
-            prot = AxiProt(getattr(aw, 'awprot', AxiProt.NONSECURE))
+            length = int(aw.awlen)
+            size = int(aw.awsize)
+            burst = AxiBurstType(int(aw.awburst))
 
-            self.log.info("Write burst awid: 0x%x awaddr: 0x%08x awlen: %d awsize: %d awprot: %s",
-                    awid, addr, length, size, prot)
+            if log_info:
+                prot = AxiProt(int(aw.awprot)) if self.awprot_present else AxiProt.NONSECURE
+                self.log.info("Write burst awid: 0x%x awaddr: 0x%08x awlen: %d awsize: %d awprot: %s",
+                        awid, addr, length, size, prot)
 
             num_bytes = 2**size
-            assert 0 < num_bytes <= self.byte_lanes
+            assert 0 < num_bytes <= byte_lanes
 
             aligned_addr = (addr // num_bytes) * num_bytes
             length += 1
@@ -135,29 +171,30 @@ class AxiRamWrite(Memory, Reset):
             cur_addr = aligned_addr
 
             for n in range(length):
-                cur_word_addr = (cur_addr // self.byte_lanes) * self.byte_lanes
+                cur_word_addr = (cur_addr // byte_lanes) * byte_lanes
 
-                w = await self.w_channel.recv()
+                if not w_channel.empty():
+                    w = w_channel.recv_nowait()
+                else:
+                    w = await w_channel.recv()
 
                 data = int(w.wdata)
-                strb = int(getattr(w, 'wstrb', self.strb_mask))
+                strb = int(w.wstrb)
                 last = int(w.wlast)
 
                 # todo latency
 
-                self.mem.seek(cur_word_addr % self.size)
-
-                data = data.to_bytes(self.byte_lanes, 'little')
+                if size_mask is not None:
+                    start = cur_word_addr & size_mask
+                else:
+                    start = cur_word_addr % mem_size
+                end = start + byte_lanes
 
-                if self.log.isEnabledFor(logging.DEBUG):
+                if log_debug:
                     self.log.debug("Write word awid: 0x%x addr: 0x%08x wstrb: 0x%02x data: %s",
-                            awid, cur_addr, strb, ' '.join((f'{c:02x}' for c in data)))
+                            awid, cur_addr, strb, _LazyHex(data.to_bytes(byte_lanes, 'little')))
 
-                for i in range(self.byte_lanes):
-                    if strb & (1 << i):
-                        self.mem.write(data[i:i+1])
-                    else:
-                        self.mem.seek(1, 1)
+                write_word(start, end, data, strb)
 
                 assert last == (n == length-1)
 
@@ -168,11 +205,14 @@ class AxiRamWrite(Memory, Reset):
                         if cur_addr == upper_wrap_boundary:
                             cur_addr = lower_wrap_boundary
 
-            b = self.b_channel._transaction_obj()
+            b = copy.copy(b_resp)
             b.bid = awid
-            b.bresp = AxiResp.OKAY
 
-            await self.b_channel.send(b)
+            # queue without yielding while the occupancy limit allows it
+            if not b_channel.full():
+                b_channel.send_nowait(b)
+            else:
+                await b_channel.send(b)
 
 
 class AxiRamRead(Memory, Reset):
@@ -211,7 +251,7 @@ class AxiRamRead(Memory, Reset):
 
         self.log.info("AXI RAM model signals:")
         for bus in (self.bus.ar, self.bus.r):
-            for sig in sorted(list(set().union(bus._signals, bus._optional_signals))):
+            for sig in _sorted_signal_list(bus):
                 if hasattr(bus, sig):
                     self.log.info("  %s width: %d bits", sig, len(getattr(bus, sig)))
                 else:
@@ -221,6 +261,17 @@ class AxiRamRead(Memory, Reset):
 
         assert len(self.r_channel.bus.rid) == len(self.ar_channel.bus.arid)
 
+        # optional signal presence never changes after elaboration
+        self.arprot_present = hasattr(self.ar_channel.bus, 'arprot')
+
+        # power-of-two sizes can wrap addresses with a mask instead of a modulus
+        self._size_mask = self.size-1 if self.size & (self.size-1) == 0 else None
+
+        # rresp never changes; clone a template instead of constructing a
+        # fresh transaction per beat
+        self._r_resp = self.r_channel._transaction_obj()
+        self._r_resp.rresp = AxiResp.OKAY
+
         self._process_read_cr = None
 
         self._init_reset(reset, reset_active_level)
@@ -237,24 +288,37 @@ class AxiRamRead(Memory, Reset):
         else:
             self.log.info("Reset de-asserted")
             if self._process_read_cr is None:
-                self._process_read_cr = cocotb.fork(self._process_read())
+                self._process_read_cr = cocotb.start_soon(self._process_read())
 
     async def _process_read(self):
+        log_info = self.log.isEnabledFor(logging.INFO)
+        log_debug = self.log.isEnabledFor(logging.DEBUG)
+
+        # bind hot attributes as locals; LOAD_FAST beats LOAD_ATTR per beat
+        ar_channel = self.ar_channel
+        r_channel = self.r_channel
+        byte_lanes = self.byte_lanes
+        mem_size = self.size
+        size_mask = self._size_mask
+        mv = self.view
+        r_resp = self._r_resp
+
         while True:
-            ar = await self.ar_channel.recv()
+            ar = await ar_channel.recv()
 
-            arid = int(getattr(ar, 'arid', 0))
+            arid = int(ar.arid)
             addr = int(ar.araddr)
-            length = int(getattr(ar, 'arlen', 0))
-            size = int(getattr(ar, 'arsize', self.max_burst_size))
-            burst = AxiBurstType(getattr(ar, 'arburst', AxiBurstType.INCR))
-            prot = AxiProt(getattr(ar, 'arprot', AxiProt.NONSECURE))
+            length = int(ar.arlen)
+            size = int(ar.arsize)
+            burst = AxiBurstType(int(ar.arburst))
 
-            self.log.info("Read burst arid: 0x%x araddr: 0x%08x arlen: %d arsize: %d arprot: %s",
-                    arid, addr, length, size, prot)
+            if log_info:
+                prot = AxiProt(int(ar.arprot)) if self.arprot_present else AxiProt.NONSECURE
+                self.log.info("Read burst arid: 0x%x araddr: 0x%08x arlen: %d arsize: %d arprot: %s",
+                        arid, addr, length, size, prot)
 
             num_bytes = 2**size
-            assert 0 < num_bytes <= self.byte_lanes
+            assert 0 < num_bytes <= byte_lanes
 
             aligned_addr = (addr // num_bytes) * num_bytes
             length += 1
@@ -272,23 +336,29 @@ class AxiRamRead(Memory, Reset):
             cur_addr = aligned_addr
 
             for n in range(length):
-                cur_word_addr = (cur_addr // self.byte_lanes) * self.byte_lanes
+                cur_word_addr = (cur_addr // byte_lanes) * byte_lanes
 
-                self.mem.seek(cur_word_addr % self.size)
+                if size_mask is not None:
+                    start = cur_word_addr & size_mask
+                else:
+                    start = cur_word_addr % mem_size
 
-                data = self.mem.read(self.byte_lanes)
+                data = mv[start:start+byte_lanes]
 
-                r = self.r_channel._transaction_obj()
+                r = copy.copy(r_resp)
                 r.rid = arid
                 r.rdata = int.from_bytes(data, 'little')
                 r.rlast = n == length-1
-                r.rresp = AxiResp.OKAY
 
-                await self.r_channel.send(r)
+                # queue without yielding while the occupancy limit allows it
+                if not r_channel.full():
+                    r_channel.send_nowait(r)
+                else:
+                    await r_channel.send(r)
 
-                if self.log.isEnabledFor(logging.DEBUG):
+                if log_debug:
                     self.log.debug("Read word awid: 0x%x addr: 0x%08x data: %s",
-                            arid, cur_addr, ' '.join((f'{c:02x}' for c in data)))
+                            arid, cur_addr, _LazyHex(bytes(data)))
 
                 if burst != AxiBurstType.FIXED:
                     cur_addr += num_bytes
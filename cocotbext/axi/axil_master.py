@@ -33,6 +33,7 @@ from .version import __version__
 from .constants import AxiProt, AxiResp
 from .axil_channels import AxiLiteAWSource, AxiLiteWSource, AxiLiteBSink, AxiLiteARSource, AxiLiteRSink
 from .reset import Reset
+from .utils import _sorted_signal_list
 
 
 # AXI lite master write helper objects
@@ -118,6 +119,7 @@ class AxiLiteMasterWrite(Reset):
         self.strb_mask = 2**self.byte_lanes-1
 
         self.awprot_present = hasattr(self.bus.aw, "awprot")
+        self.bresp_present = hasattr(self.bus.b, "bresp")
 
         self.log.info("AXI lite master configuration:")
         self.log.info("  Address width: %d bits", self.address_width)
@@ -126,7 +128,7 @@ class AxiLiteMasterWrite(Reset):
 
         self.log.info("AXI lite master signals:")
         for bus in (self.bus.aw, self.bus.w, self.bus.b):
-            for sig in sorted(list(set().union(bus._signals, bus._optional_signals))):
+            for sig in _sorted_signal_list(bus):
                 if hasattr(bus, sig):
                     self.log.info("  %s width: %d bits", sig, len(getattr(bus, sig)))
                 else:
@@ -242,9 +244,9 @@ class AxiLiteMasterWrite(Reset):
         else:
             self.log.info("Reset de-asserted")
             if self._process_write_cr is None:
-                self._process_write_cr = cocotb.fork(self._process_write())
+                self._process_write_cr = cocotb.start_soon(self._process_write())
             if self._process_write_resp_cr is None:
-                self._process_write_resp_cr = cocotb.fork(self._process_write_resp())
+                self._process_write_resp_cr = cocotb.start_soon(self._process_write_resp())
 
     async def _process_write(self):
         while True:
@@ -310,7 +312,7 @@ class AxiLiteMasterWrite(Reset):
             for k in range(cmd.cycles):
                 b = await self.b_channel.recv()
 
-                cycle_resp = AxiResp(getattr(b, 'bresp', AxiResp.OKAY))
+                cycle_resp = AxiResp(int(b.bresp)) if self.bresp_present else AxiResp.OKAY
 
                 if cycle_resp != AxiResp.OKAY:
                     resp = cycle_resp
@@ -363,6 +365,7 @@ class AxiLiteMasterRead(Reset):
         self.byte_lanes = self.width // self.byte_size
 
         self.arprot_present = hasattr(self.bus.ar, "arprot")
+        self.rresp_present = hasattr(self.bus.r, "rresp")
 
         self.log.info("AXI lite master configuration:")
         self.log.info("  Address width: %d bits", self.address_width)
@@ -371,7 +374,7 @@ class AxiLiteMasterRead(Reset):
 
         self.log.info("AXI lite master signals:")
         for bus in (self.bus.ar, self.bus.r):
-            for sig in sorted(list(set().union(bus._signals, bus._optional_signals))):
+            for sig in _sorted_signal_list(bus):
                 if hasattr(bus, sig):
                     self.log.info("  %s width: %d bits", sig, len(getattr(bus, sig)))
                 else:
@@ -482,9 +485,9 @@ class AxiLiteMasterRead(Reset):
         else:
             self.log.info("Reset de-asserted")
             if self._process_read_cr is None:
-                self._process_read_cr = cocotb.fork(self._process_read())
+                self._process_read_cr = cocotb.start_soon(self._process_read())
             if self._process_read_resp_cr is None:
-                self._process_read_resp_cr = cocotb.fork(self._process_read_resp())
+                self._process_read_resp_cr = cocotb.start_soon(self._process_read_resp())
 
     async def _process_read(self):
         while True:
@@ -526,7 +529,7 @@ class AxiLiteMasterRead(Reset):
                 r = await self.r_channel.recv()
 
                 cycle_data = int(r.rdata)
-                cycle_resp = AxiResp(getattr(r, 'rresp', AxiResp.OKAY))
+                cycle_resp = AxiResp(int(r.rresp)) if self.rresp_present else AxiResp.OKAY
 
                 if cycle_resp != AxiResp.OKAY:
                     resp = cycle_resp
@@ -22,6 +22,7 @@ THE SOFTWARE.
 
 """
 
+import copy
 import logging
 
 import cocotb
@@ -29,8 +30,9 @@ import cocotb
 from .version import __version__
 from .constants import AxiProt, AxiResp
 from .axil_channels import AxiLiteAWSink, AxiLiteWSink, AxiLiteBSource, AxiLiteARSink, AxiLiteRSource
-from .memory import Memory
+from .memory import Memory, _make_word_writer
 from .reset import Reset
+from .utils import _LazyHex, _sorted_signal_list
 
 
 class AxiLiteRamWrite(Memory, Reset):
@@ -60,6 +62,14 @@ class AxiLiteRamWrite(Memory, Reset):
         self.byte_lanes = self.width // self.byte_size
         self.strb_mask = 2**self.byte_lanes-1
 
+        self._strb_to_mask = {}
+
+        if self.byte_lanes <= 8:
+            # small enough to enumerate every strobe combination up front
+            for strb in range(2**self.byte_lanes):
+                self._strb_to_mask[strb] = int.from_bytes(bytes(0xff if strb & (1 << i) else 0
+                        for i in range(self.byte_lanes)), 'little')
+
         self.log.info("AXI lite RAM model configuration:")
         self.log.info("  Memory size: %d bytes", len(self.mem))
         self.log.info("  Address width: %d bits", self.address_width)
@@ -68,7 +78,7 @@ class AxiLiteRamWrite(Memory, Reset):
 
         self.log.info("AXI lite RAM model signals:")
         for bus in (self.bus.aw, self.bus.w, self.bus.b):
-            for sig in sorted(list(set().union(bus._signals, bus._optional_signals))):
+            for sig in _sorted_signal_list(bus):
                 if hasattr(bus, sig):
                     self.log.info("  %s width: %d bits", sig, len(getattr(bus, sig)))
                 else:
@@ -77,6 +87,18 @@ class AxiLiteRamWrite(Memory, Reset):
         assert self.byte_lanes == len(self.w_channel.bus.wstrb)
         assert self.byte_lanes * self.byte_size == self.width
 
+        # optional signal presence never changes after elaboration
+        self.awprot_present = hasattr(self.aw_channel.bus, 'awprot')
+
+        # power-of-two sizes can wrap addresses with a mask instead of a modulus
+        self._size_mask = self.size-1 if self.size & (self.size-1) == 0 else None
+
+        self._write_word = _make_word_writer(self.view, self.byte_lanes, self.strb_mask, self._strb_to_mask)
+
+        # every B beat from this model is identical; one object serves all
+        self._b_resp = self.b_channel._transaction_obj()
+        self._b_resp.bresp = AxiResp.OKAY
+
         self._process_write_cr = None
 
         self._init_reset(reset, reset_active_level)
@@ -94,40 +116,67 @@ class AxiLiteRamWrite(Memory, Reset):
         else:
             self.log.info("Reset de-asserted")
             if self._process_write_cr is None:
-                self._process_write_cr = cocotb.fork(self._process_write())
+                self._process_write_cr = cocotb.start_soon(self._process_write())
 
     async def _process_write(self):
+        log_info = self.log.isEnabledFor(logging.INFO)
+
+        # bind hot attributes as locals; LOAD_FAST beats LOAD_ATTR per beat
+        aw_channel = self.aw_channel
+        w_channel = self.w_channel
+        b_channel = self.b_channel
+        byte_lanes = self.byte_lanes
+        size = self.size
+        size_mask = self._size_mask
+        write_word = self._write_word
+        b_resp = self._b_resp
+
         while True:
-            aw = await self.aw_channel.recv()
+            if not aw_channel.empty() and not w_channel.empty():
+                aw = aw_channel.recv_nowait()
+                w = w_channel.recv_nowait()
+            else:
+                aw = await aw_channel.recv()
+                w = await w_channel.recv()
 
-            addr = (int(aw.awaddr) // self.byte_lanes) * self.byte_lanes
-            prot = AxiProt(getattr(aw, 'awprot', AxiProt.NONSECURE))
+            resp = []
 
-            w = await self.w_channel.recv()
+            # drain all queued AW/W pairs before yielding to the scheduler
+            while True:
+                addr = (int(aw.awaddr) // byte_lanes) * byte_lanes
 
-            data = int(w.wdata)
-            strb = int(getattr(w, 'wstrb', self.strb_mask))
+                data = int(w.wdata)
+                strb = int(w.wstrb)
 
-            # todo latency
+                # todo latency
 
-            self.mem.seek(addr % self.size)
+                if size_mask is not None:
+                    start = addr & size_mask
+                else:
+                    start = addr % size
+                end = start + byte_lanes
 
-            data = data.to_bytes(self.byte_lanes, 'little')
+                if log_info:
+                    prot = AxiProt(int(aw.awprot)) if self.awprot_present else AxiProt.NONSECURE
+                    self.log.info("Write data awaddr: 0x%08x awprot: %s wstrb: 0x%02x data: %s",
+                            addr, prot, strb, _LazyHex(data.to_bytes(byte_lanes, 'little')))
 
-            if self.log.isEnabledFor(logging.INFO):
-                self.log.info("Write data awaddr: 0x%08x awprot: %s wstrb: 0x%02x data: %s",
-                        addr, prot, strb, ' '.join((f'{c:02x}' for c in data)))
+                write_word(start, end, data, strb)
 
-            for i in range(self.byte_lanes):
-                if strb & (1 << i):
-                    self.mem.write(data[i:i+1])
-                else:
-                    self.mem.seek(1, 1)
+                resp.append(b_resp)
+
+                if aw_channel.empty() or w_channel.empty():
+                    break
 
-            b = self.b_channel._transaction_obj()
-            b.bresp = AxiResp.OKAY
+                aw = aw_channel.recv_nowait()
+                w = w_channel.recv_nowait()
 
-            await self.b_channel.send(b)
+            for b in resp:
+                # queue without yielding while the occupancy limit allows it
+                if not b_channel.full():
+                    b_channel.send_nowait(b)
+                else:
+                    await b_channel.send(b)
 
 
 class AxiLiteRamRead(Memory, Reset):
@@ -162,7 +211,7 @@ class AxiLiteRamRead(Memory, Reset):
 
         self.log.info("AXI lite RAM model signals:")
         for bus in (self.bus.ar, self.bus.r):
-            for sig in sorted(list(set().union(bus._signals, bus._optional_signals))):
+            for sig in _sorted_signal_list(bus):
                 if hasattr(bus, sig):
                     self.log.info("  %s width: %d bits", sig, len(getattr(bus, sig)))
                 else:
@@ -170,6 +219,17 @@ class AxiLiteRamRead(Memory, Reset):
 
         assert self.byte_lanes * self.byte_size == self.width
 
+        # optional signal presence never changes after elaboration
+        self.arprot_present = hasattr(self.ar_channel.bus, 'arprot')
+
+        # power-of-two sizes can wrap addresses with a mask instead of a modulus
+        self._size_mask = self.size-1 if self.size & (self.size-1) == 0 else None
+
+        # rdata is the only per-beat field; clone a template instead of
+        # constructing a fresh transaction each time
+        self._r_resp = self.r_channel._transaction_obj()
+        self._r_resp.rresp = AxiResp.OKAY
+
         self._process_read_cr = None
 
         self._init_reset(reset, reset_active_level)
@@ -186,30 +246,54 @@ class AxiLiteRamRead(Memory, Reset):
         else:
             self.log.info("Reset de-asserted")
             if self._process_read_cr is None:
-                self._process_read_cr = cocotb.fork(self._process_read())
+                self._process_read_cr = cocotb.start_soon(self._process_read())
 
     async def _process_read(self):
+        log_info = self.log.isEnabledFor(logging.INFO)
+
+        # bind hot attributes as locals; LOAD_FAST beats LOAD_ATTR per beat
+        ar_channel = self.ar_channel
+        r_channel = self.r_channel
+        byte_lanes = self.byte_lanes
+        size = self.size
+        size_mask = self._size_mask
+        mv = self.view
+        r_resp = self._r_resp
+
         while True:
-            ar = await self.ar_channel.recv()
+            ar = await ar_channel.recv()
+
+            # drain all queued AR requests before yielding to the scheduler
+            while True:
+                addr = (int(ar.araddr) // byte_lanes) * byte_lanes
 
-            addr = (int(ar.araddr) // self.byte_lanes) * self.byte_lanes
-            prot = AxiProt(getattr(ar, 'arprot', AxiProt.NONSECURE))
+                # todo latency
 
-            # todo latency
+                if size_mask is not None:
+                    start = addr & size_mask
+                else:
+                    start = addr % size
 
-            self.mem.seek(addr % self.size)
+                data = mv[start:start+byte_lanes]
 
-            data = self.mem.read(self.byte_lanes)
+                r = copy.copy(r_resp)
+                r.rdata = int.from_bytes(data, 'little')
+
+                # queue without yielding while the occupancy limit allows it
+                if not r_channel.full():
+                    r_channel.send_nowait(r)
+                else:
+                    await r_channel.send(r)
 
-            r = self.r_channel._transaction_obj()
-            r.rdata = int.from_bytes(data, 'little')
-            r.rresp = AxiResp.OKAY
+                if log_info:
+                    prot = AxiProt(int(ar.arprot)) if self.arprot_present else AxiProt.NONSECURE
+                    self.log.info("Read data araddr: 0x%08x arprot: %s data: %s",
+                            addr, prot, _LazyHex(bytes(data)))
 
-            await self.r_channel.send(r)
+                if ar_channel.empty():
+                    break
 
-            if self.log.isEnabledFor(logging.INFO):
-                self.log.info("Read data araddr: 0x%08x arprot: %s data: %s",
-                        addr, prot, ' '.join((f'{c:02x}' for c in data)))
+                ar = ar_channel.recv_nowait()
 
 
 class AxiLiteRam(Memory):
@@ -32,6 +32,7 @@ from cocotb_bus.bus import Bus
 
 from .version import __version__
 from .reset import Reset
+from .utils import _sorted_signal_list
 
 
 class AxiStreamFrame:
@@ -321,7 +322,7 @@ class AxiStreamBase(Reset):
         self.log.info("  Data width: %d bits (%d bytes)", self.width, self.byte_lanes)
 
         self.log.info("AXI stream %s signals:", self._type)
-        for sig in sorted(list(set().union(self.bus._signals, self.bus._optional_signals))):
+        for sig in _sorted_signal_list(self.bus):
             if hasattr(self.bus, sig):
                 self.log.info("  %s width: %d bits", sig, len(getattr(self.bus, sig)))
             else:
@@ -366,7 +367,7 @@ class AxiStreamBase(Reset):
         else:
             self.log.info("Reset de-asserted")
             if self._run_cr is None:
-                self._run_cr = cocotb.fork(self._run())
+                self._run_cr = cocotb.start_soon(self._run())
 
     async def _run(self):
         raise NotImplementedError()
@@ -388,7 +389,7 @@ class AxiStreamPause:
         self._pause_generator = generator
 
         if self._pause_generator is not None:
-            self._pause_cr = cocotb.fork(self._run_pause())
+            self._pause_cr = cocotb.start_soon(self._run_pause())
 
     def clear_pause_generator(self):
         self.set_pause_generator(None)
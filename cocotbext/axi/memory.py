@@ -22,27 +22,45 @@ THE SOFTWARE.
 
 """
 
-import mmap
-
 from .utils import hexdump, hexdump_lines, hexdump_str
 
 
+def _make_word_writer(mem, byte_lanes, strb_mask, strb_to_mask):
+    # specialize the write splice for a fixed data width at construction
+    # time; the closure binds the per-instance constants so the per-beat
+    # call carries no attribute lookups
+    def write_word(start, end, data, strb):
+        if strb == strb_mask:
+            mem[start:end] = data.to_bytes(byte_lanes, 'little')
+        else:
+            mask = strb_to_mask.get(strb)
+            if mask is None:
+                mask = int.from_bytes(bytes(0xff if strb & (1 << i) else 0
+                        for i in range(byte_lanes)), 'little')
+                strb_to_mask[strb] = mask
+            old = int.from_bytes(mem[start:end], 'little')
+            mem[start:end] = ((data & mask) | (old & ~mask)).to_bytes(byte_lanes, 'little')
+    return write_word
+
+
 class Memory:
     def __init__(self, size=1024, mem=None, *args, **kwargs):
         if mem is not None:
             self.mem = mem
         else:
-            self.mem = mmap.mmap(-1, size)
+            self.mem = bytearray(size)
         self.size = len(self.mem)
+        # position-less window into the backing store; models holding the
+        # same mem splice through it by absolute index without shared state
+        self.view = memoryview(self.mem)
         super().__init__(*args, **kwargs)
 
     def read(self, address, length):
-        self.mem.seek(address)
-        return self.mem.read(length)
+        return bytes(self.view[address:address+length])
 
     def write(self, address, data):
-        self.mem.seek(address)
-        self.mem.write(bytes(data))
+        data = bytes(data)
+        self.mem[address:address+len(data)] = data
 
     def write_words(self, address, data, byteorder='little', ws=2):
         words = data
@@ -23,6 +23,31 @@ THE SOFTWARE.
 """
 
 
+_signal_list_cache = {}
+
+
+def _sorted_signal_list(bus):
+    # signal name lists are class-level constants on the generated bus types,
+    # so the sorted union only needs to be computed once per bus class
+    key = type(bus)
+    sig_list = _signal_list_cache.get(key)
+    if sig_list is None:
+        sig_list = sorted(set().union(bus._signals, bus._optional_signals))
+        _signal_list_cache[key] = sig_list
+    return sig_list
+
+
+class _LazyHex:
+    # defers hex formatting of log arguments until the record is emitted
+    __slots__ = ('data',)
+
+    def __init__(self, data):
+        self.data = data
+
+    def __str__(self):
+        return ' '.join(f'{c:02x}' for c in self.data)
+
+
 def hexdump_line(data, offset, row_size=16):
     h = ""
     c = ""